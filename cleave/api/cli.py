@@ -27,7 +27,7 @@ from cleave.core.client.control import BaseControllerInterface
 from cleave.core.client.physicalsim import PhysicalSimulation
 from cleave.core.client.plant import CSVRecordingPlant
 from cleave.core.config import Config, ConfigFile
-from cleave.core.logging import loguru
+from cleave.core.logging import LogLevel, loguru, set_min_level
 from cleave.core.network.backend import BaseControllerService, \
     UDPControllerService
 from cleave.core.network.client import RecordingUDPControlClient
@@ -117,9 +117,12 @@ def cli(version: bool,
 
     # configure logging
     log_level = max(loguru.logger.level('CRITICAL').no - (verbose * 10), 0)
+    # sinks are enqueued so that formatting and I/O happen in loguru's
+    # worker thread instead of on the reactor thread
     loguru.logger.add(sys.stderr,
                       level=log_level,
                       colorize=colorize_logs,
+                      enqueue=True,
                       format='<light-green>{time}</light-green> '
                              '<level><b>{level}</b></level> '
                              '{message}')
@@ -128,9 +131,18 @@ def cli(version: bool,
         loguru.logger.add(file_log,
                           level=loguru.logger.level('DEBUG').no,
                           colorize=False,
+                          enqueue=True,
                           format='<light-green>{time}</light-green> '
                                  '<level><b>{level}</b></level> '
                                  '{message}')
+    else:
+        # events below the STDERR threshold would be discarded by loguru
+        # anyway, so drop them before they are formatted
+        set_min_level([LogLevel.critical,
+                       LogLevel.error,
+                       LogLevel.warn,
+                       LogLevel.info,
+                       LogLevel.debug][min(verbose, 4)])
 
 
 @cli.command('run-plant')
@@ -157,6 +169,8 @@ def run_plant(config_file_path: str):
     for c in config.shutdown_callbacks:
         reactor.addSystemEventTrigger('during', 'shutdown', c)
     reactor.run()
+    # wait for enqueued log messages to be written
+    loguru.logger.complete()
 
 
 @cli.command('run-controller')
@@ -188,3 +202,4 @@ def run_controller(config_file_path: str):
                                            maxthreads=10)
     reactor.listenUDP(config.port, service.protocol)
     reactor.run()
+    loguru.logger.complete()
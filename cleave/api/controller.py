@@ -26,6 +26,12 @@ class Controller(ABC):
     extending subclasses need to implement.
     """
 
+    #: Controllers whose process() method is quick and never blocks can set
+    #: this to True to have it invoked directly on the networking thread,
+    #: skipping the hand-off to a separate processing thread. Note that a
+    #: slow process() will then delay all network I/O of the controller.
+    process_is_sync: bool = False
+
     def __init__(self):
         super(Controller, self).__init__()
 
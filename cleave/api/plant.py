@@ -43,6 +43,8 @@ class ControllerParameter(BaseSemanticVariable):
     on initialization
     """
 
+    __slots__ = ()
+
     def __init__(self, value: Any, record: bool = False):
         # by default, controller parameters are not recorded
         super(ControllerParameter, self).__init__(value, record)
@@ -54,7 +56,8 @@ class SensorVariable(BaseSemanticVariable):
     by a sensor. Variables of this type will automatically be paired with the
     corresponding Sensor during emulation.
     """
-    pass
+
+    __slots__ = ()
 
 
 class ActuatorVariable(BaseSemanticVariable):
@@ -63,7 +66,8 @@ class ActuatorVariable(BaseSemanticVariable):
     by an actuator. Variables of this type will automatically be paired with the
     corresponding Actuator during emulation.
     """
-    pass
+
+    __slots__ = ()
 
 
 class State(StateBase, ABC):
@@ -75,26 +79,49 @@ class State(StateBase, ABC):
     """
 
     def __setattr__(self, key, value):
+        # semantic variables assigned as attributes are registered,
+        # everything else (e.g. per-tick updates in advance()) is stored as-is
         if isinstance(value, BaseSemanticVariable):
-            # registering a new physical property
-            if isinstance(value, SensorVariable):
-                self._sensor_vars.add(key)
-            elif isinstance(value, ActuatorVariable):
-                self._actuator_vars.add(key)
-            elif isinstance(value, ControllerParameter):
-                self._controller_params.add(key)
-
-            # mark it as recordable or not
-            if value.record:
-                self._record_vars.add(key)
-
-            # if it has a sanity check, register it
-            if value.sanity_check is not None:
-                self._sanity_checks[key] = value.sanity_check
-
-            # unpack value to discard wrapper object
-            value = value.value
-        super(State, self).__setattr__(key, value)
+            self.register_variable(key, value)
+        else:
+            super(State, self).__setattr__(key, value)
+
+    def register_variable(self, name: str, var: BaseSemanticVariable) -> None:
+        """
+        Registers a semantic variable in this state and sets the
+        corresponding attribute to its initial value. Assigning a semantic
+        variable to an attribute of the state is equivalent to calling this
+        method.
+
+        Parameters
+        ----------
+        name
+            Name of the variable, i.e. the attribute under which its value
+            will be stored in this state.
+        var
+            The semantic variable to register.
+        """
+
+        # registering a new physical property
+        if isinstance(var, SensorVariable):
+            self._sensor_vars.add(name)
+        elif isinstance(var, ActuatorVariable):
+            self._actuator_vars.add(name)
+        elif isinstance(var, ControllerParameter):
+            self._controller_params.add(name)
+
+        # mark it as recordable or not
+        if var.record:
+            self._record_vars.add(name)
+
+        # if it has a sanity check, register it
+        if var.sanity_check is not None:
+            self._sanity_checks[name] = var.sanity_check
+
+        self._invalidate_registry_caches()
+
+        # unpack value to discard wrapper object
+        super(State, self).__setattr__(name, var.value)
 
     @abstractmethod
     def advance(self, delta_t: float) -> None:
@@ -335,10 +362,9 @@ class SimpleImpulseActuator(Actuator):
         PhyPropType
             The actuation value.
         """
-        try:
-            return self._value
-        finally:
-            self._value = self._default_value
+        value = self._value
+        self._value = self._default_value
+        return value
 
 
 class GaussianConstantActuator(SimpleConstantActuator):
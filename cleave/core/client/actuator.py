@@ -11,11 +11,11 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+import sys
 from typing import Collection, Sequence, Set
 
 import numpy as np
 
-from .timing import SimTicker
 from ..logging import Logger
 from .control import BaseControllerInterface
 from ..recordable import NamedRecordable, Recordable, Recorder
@@ -45,7 +45,7 @@ class ActuatorArray(Recordable):
         self._log = Logger()
         self._actuators = dict()
         self._control = control
-        self._ticker = SimTicker()
+        self._ticks = 0
 
         for actuator in actuators:
             if actuator.actuated_property_name in self._actuators:
@@ -69,6 +69,16 @@ class ActuatorArray(Recordable):
             opt_record_fields=opt_record_fields
         )
 
+        # actuators paired with their record field names, formatted once
+        # instead of on every tick; namedtuple interns its field names, so
+        # interning these too lets keyword matching in push_record() succeed
+        # on identity
+        self._record_keys = tuple(
+            (prop, act,
+             sys.intern(f'{prop}_value'), sys.intern(f'{prop}_target'))
+            for prop, act in self._actuators.items()
+        )
+
     def get_actuation_inputs(self) -> PhyPropMapping:
         """
         Fetches raw commands from the controller, processes them and returns.
@@ -84,7 +94,8 @@ class ActuatorArray(Recordable):
 
         """
 
-        self._ticker.tick()
+        ticks = self._ticks + 1
+        self._ticks = ticks
 
         raw_cmds = self._control.get_actuator_values()
 
@@ -100,20 +111,31 @@ class ActuatorArray(Recordable):
                 continue
         # record inputs and outputs
         record = {
-            'tick': self._ticker.total_ticks,
+            'tick': ticks,
         }
         act_values = {}
 
-        for prop, act in self._actuators.items():
+        for prop, act, value_key, target_key in self._record_keys:
             actuation = act.get_actuation()
             act_values[prop] = actuation
-            record[f'{prop}_value'] = actuation
-            record[f'{prop}_target'] = raw_cmds.get(prop)
+            record[value_key] = actuation
+            record[target_key] = raw_cmds.get(prop)
 
         self._records.push_record(**record)
 
         return act_values
 
+    @property
+    def actuated_prop_names(self) -> Sequence[str]:
+        """
+        Returns
+        -------
+        Sequence
+            Names of the properties actuated by the actuators in this array,
+            i.e. the keys of the mapping returned by get_actuation_inputs().
+        """
+        return tuple(self._actuators.keys())
+
     @property
     def recorders(self) -> Set[Recorder]:
         return self._records.recorders
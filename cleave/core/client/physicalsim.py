@@ -11,7 +11,8 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from typing import Sequence, Set
+import operator
+from typing import Any, Callable, Collection, Sequence, Set, Tuple
 
 from .timing import SimTicker
 from ..logging import Logger
@@ -20,6 +21,21 @@ from ...api.plant import State, UnrecoverableState
 from ...api.util import PhyPropMapping
 
 
+def _make_tuple_getter(names: Sequence[str]) -> Callable[[Any], Tuple]:
+    """
+    Builds a callable which reads the named attributes from an object and
+    always returns them as a tuple, in the same order as the names.
+    """
+    if len(names) == 0:
+        return lambda obj: ()
+    elif len(names) == 1:
+        # attrgetter returns a bare value instead of a 1-tuple in this case
+        getter = operator.attrgetter(names[0])
+        return lambda obj: (getter(obj),)
+    else:
+        return operator.attrgetter(*names)
+
+
 class PhysicalSimulation(Recordable):
     def __init__(self, state: State, tick_rate: int):
         super(PhysicalSimulation, self).__init__()
@@ -34,13 +50,30 @@ class PhysicalSimulation(Recordable):
         self._act_vars = self._state.get_actuated_prop_names()
         self._sensor_vars = self._state.get_sensed_prop_names()
 
+        # the plant shape is fixed for the lifetime of the simulation,
+        # so record field names are built once instead of on every tick
+        self._input_fields = {var: f'input_{var}' for var in self._act_vars}
+        self._output_fields = {var: f'output_{var}'
+                               for var in self._sensor_vars}
+
+        # sensed variables are read in bulk, in a fixed order, on each tick
+        self._sensed_names = tuple(self._output_fields.keys())
+        self._sensed_fields = tuple(self._output_fields.values())
+        self._read_sensed = _make_tuple_getter(self._sensed_names)
+        # output mapping is reused and overwritten on every tick
+        self._sensed_props = dict.fromkeys(self._sensed_names)
+
+        # (name, record field) pairs for the actuation inputs fed to the state
+        # on each tick, narrowed down by configure_actuators()
+        self._actuated_inputs = tuple(self._input_fields.items())
+
         tick_rec = ['tick', 'tick_dt']
 
         self._recordable = NamedRecordable(
             name=self.__class__.__name__,
             record_fields=tick_rec +
-                          [f'input_{var}' for var in self._act_vars] +
-                          [f'output_{var}' for var in self._sensor_vars]
+                          list(self._input_fields.values()) +
+                          list(self._output_fields.values())
         )
 
     @property
@@ -73,6 +106,29 @@ class PhysicalSimulation(Recordable):
     def shutdown(self) -> None:
         self._state.shutdown()
 
+    def configure_actuators(self, prop_names: Collection[str]) -> None:
+        """
+        Sets the actuated properties which will be provided as inputs on
+        each call to advance_state(). Names which do not correspond to an
+        actuated variable in the state are reported once here and ignored
+        from then on. If this method is never called, all the actuated
+        variables of the state are expected as inputs.
+
+        Parameters
+        ----------
+        prop_names
+            Names of the properties actuated by the plant.
+        """
+        unknown = [name for name in prop_names
+                   if name not in self._input_fields]
+        for name in unknown:
+            self._log.warn('Actuator registered for unknown actuated '
+                           f'property "{name}", its inputs will be ignored.')
+
+        self._actuated_inputs = tuple((name, self._input_fields[name])
+                                      for name in prop_names
+                                      if name in self._input_fields)
+
     def advance_state(self,
                       input_values: PhyPropMapping) -> PhyPropMapping:
         """
@@ -82,23 +138,24 @@ class PhysicalSimulation(Recordable):
         Parameters
         ----------
         input_values
-            Actuation inputs.
+            Actuation inputs. Must contain a value for each of the properties
+            set through configure_actuators().
 
         Returns
         -------
         PhyPropMapping
-            Mapping from sensed property names to values.
+            Mapping from sensed property names to values. The same mapping
+            is reused and updated in-place on every step, so callers must
+            not modify or hold on to it past the current tick.
 
         """
         record = {}
 
-        for name, val in input_values.items():
-            if name in self._act_vars:
-                self._state.__setattr__(name, val)
-                record[f'input_{name}'] = val
-            else:
-                self._log.warn('Received update for unregistered actuated '
-                               f'property "{name}", skipping...')
+        state = self._state
+        for name, field in self._actuated_inputs:
+            val = input_values[name]
+            setattr(state, name, val)
+            record[field] = val
 
         delta_t = self._ticker.tick()
         self._state.advance(delta_t)
@@ -111,11 +168,10 @@ class PhysicalSimulation(Recordable):
             # exceeded some angle...)
             raise UnrecoverableState(failed_sanity_check)
 
-        sensed_props = {}
-        for name in self._sensor_vars:
-            val = self._state.__getattribute__(name)
-            sensed_props[name] = val
-            record[f'output_{name}'] = val
+        sensed_values = self._read_sensed(self._state)
+        sensed_props = self._sensed_props
+        sensed_props.update(zip(self._sensed_names, sensed_values))
+        record.update(zip(self._sensed_fields, sensed_values))
 
         # record
         record['tick'] = self._ticker.total_ticks
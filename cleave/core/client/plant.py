@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import time
 from abc import ABC
 from typing import Collection
 from pathlib import Path
@@ -33,6 +34,9 @@ from .control import BaseControllerInterface
 from ..recordable import CSVRecorder
 from ...api.plant import Actuator, Sensor, UnrecoverableState
 
+#: Minimum interval between consecutive warnings about missed plant ticks.
+_OVERLOAD_LOG_INTERVAL_NS = 1_000_000_000
+
 
 class Plant(ABC):
     """
@@ -123,6 +127,7 @@ class BasePlant(Plant):
 
         # TODO: needs to be moved into base class
         self._ticker_loop = task.LoopingCall(self._log_plant_rate_callback)
+        self._last_overload_log_ns = 0
 
         self._sensors = SensorArray(
             sensors=sensors,
@@ -135,6 +140,16 @@ class BasePlant(Plant):
             control=self._control
         )
 
+        # actuation inputs always have the same keys, so they are matched
+        # against the state once instead of on every tick
+        self._physim.configure_actuators(self._actuators.actuated_prop_names)
+
+        # bound once, tick() runs at the full emulation rate
+        self._get_actuation_inputs = self._actuators.get_actuation_inputs
+        self._advance_state = self._physim.advance_state
+        self._process_and_send_samples = \
+            self._sensors.process_and_send_samples
+
     def on_init(self) -> None:
         """
         Sets up the simulation of this plant
@@ -168,16 +183,21 @@ class BasePlant(Plant):
         # 3. advance state
         # 4. process sensor outputs
         # 5. send sensor outputs
-        # TODO: check that timings are respected!
-        # if count > 1:
-        #     self._logger.warn('Emulation step took longer '
-        #                       'than allotted time slot!', )
-
-        actuator_outputs = self._actuators.get_actuation_inputs()
-        state_outputs = self._physim.advance_state(actuator_outputs)
+        if missed_count > 1:
+            # rate-limited, to avoid piling log output on top of an already
+            # overloaded tick
+            now = time.monotonic_ns()
+            if now - self._last_overload_log_ns >= _OVERLOAD_LOG_INTERVAL_NS:
+                self._last_overload_log_ns = now
+                self._logger.warn('Emulation step took longer than allotted '
+                                  'time slot! ({missed} ticks missed)',
+                                  missed=missed_count - 1)
+
+        actuator_outputs = self._get_actuation_inputs()
+        state_outputs = self._advance_state(actuator_outputs)
         # sensor_outputs = {}
         # this only sends if any sensors are triggered during this state update
-        self._sensors.process_and_send_samples(prop_values=state_outputs)
+        self._process_and_send_samples(prop_values=state_outputs)
 
     def on_tick_error(self, fail: Failure) -> None:
         fail.trap(UnrecoverableState)
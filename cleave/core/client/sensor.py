@@ -14,11 +14,11 @@
 
 from __future__ import annotations
 
+import sys
 from typing import Collection, Dict, Sequence, Set
 
 import numpy as np
 
-from .timing import SimTicker
 from ..logging import Logger
 from .control import BaseControllerInterface
 from ..recordable import NamedRecordable, Recordable, Recorder
@@ -58,7 +58,7 @@ class SensorArray(Recordable):
         self._control = control
 
         self._log = Logger()
-        self._ticker = SimTicker()
+        self._ticks = 0
 
         self._prop_sensors = dict()
         self._cycle_triggers = dict()
@@ -97,18 +97,26 @@ class SensorArray(Recordable):
 
                 self._cycle_triggers[trigger].append(sensor)
 
-            # set up underlying recorder
-            record_fields = ['tick']
-            opt_record_fields = {}
-            for prop in self._prop_sensors.keys():
-                record_fields.append(f'{prop}_value')
-                opt_record_fields[f'{prop}_sample'] = np.nan
-
-            self._records = NamedRecordable(
-                name=self.__class__.__name__,
-                record_fields=record_fields,
-                opt_record_fields=opt_record_fields
-            )
+        # set up underlying recorder
+        record_fields = ['tick']
+        opt_record_fields = {}
+        for prop in self._prop_sensors.keys():
+            record_fields.append(f'{prop}_value')
+            opt_record_fields[f'{prop}_sample'] = np.nan
+
+        self._records = NamedRecordable(
+            name=self.__class__.__name__,
+            record_fields=record_fields,
+            opt_record_fields=opt_record_fields
+        )
+
+        # record field names for each property, formatted once instead of on
+        # every tick; namedtuple interns its field names, so interning these
+        # too lets keyword matching in push_record() succeed on identity
+        self._record_keys = tuple(
+            (prop, sys.intern(f'{prop}_value'), sys.intern(f'{prop}_sample'))
+            for prop in self._prop_sensors.keys()
+        )
 
     def process_and_send_samples(self,
                                  prop_values: PhyPropMapping) -> None:
@@ -129,40 +137,39 @@ class SensorArray(Recordable):
             sensor values.
 
         """
-        self._ticker.tick()
-        ticks = self._ticker.total_ticks
+        ticks = self._ticks + 1
+        self._ticks = ticks
 
         cycle = ticks % self._plant_tick_rate
         sensor_samples = dict()
-        try:
-            # check which sensors need to be updated this cycle and send them
-            for sensor in self._cycle_triggers[cycle]:
+
+        # check which sensors need to be updated this cycle and send them;
+        # most cycles have no sensors triggered, so avoid raising on those
+        triggered = self._cycle_triggers.get(cycle)
+        if triggered is not None:
+            for sensor in triggered:
+                prop_name = sensor.measured_property_name
                 try:
-                    prop_name = sensor.measured_property_name
                     value = prop_values[prop_name]
-                    sensor_samples[prop_name] = sensor.process_sample(value)
                 except KeyError:
                     raise MissingPropertyError(
                         'Missing expected update for property '
-                        f'{sensor.measured_property_name}!')
+                        f'{prop_name}!')
+                sensor_samples[prop_name] = sensor.process_sample(value)
 
             # finally, if we have anything to send, send it
             self._control.put_sensor_values(sensor_samples)
-        except KeyError:
-            # no sensors on this cycle
-            # raise NoSensorUpdate()
-            pass
-        finally:
-            # record stuff
-            record = {
-                'tick': ticks,
-            }
-
-            for prop in self._prop_sensors.keys():
-                record[f'{prop}_value'] = prop_values.get(prop, np.nan)
-                record[f'{prop}_sample'] = sensor_samples.get(prop)
-
-            self._records.push_record(**record)
+
+        # record stuff
+        record = {
+            'tick': ticks,
+        }
+
+        for prop, value_key, sample_key in self._record_keys:
+            record[value_key] = prop_values.get(prop, np.nan)
+            record[sample_key] = sensor_samples.get(prop)
+
+        self._records.push_record(**record)
 
     @property
     def recorders(self) -> Set[Recorder]:
@@ -11,25 +11,25 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-import abc
 from abc import ABC
-from copy import copy
-from typing import Any, Callable, Dict, Optional, Set, SupportsBytes, \
-    SupportsFloat, \
-    SupportsInt, \
-    final
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple, final
 
 from ...api.util import PhyPropMapping
 
 
-class BaseSemanticVariable(SupportsFloat,
-                           SupportsInt,
-                           SupportsBytes,
-                           abc.ABC):
+class BaseSemanticVariable:
     """
     Base class for semantically significant variables in a State.
+
+    Note that this class deliberately does not derive from abc.ABC or the
+    typing.Supports* protocols (it still implements __float__, __int__ and
+    __bytes__): State.__setattr__ checks every assigned value against it,
+    and ABCMeta would turn each of those checks into a Python-level
+    __instancecheck__ call.
     """
 
+    __slots__ = ('_value', '_record', '_check')
+
     def __init__(self,
                  value: Any,
                  record: bool = True,
@@ -91,25 +91,44 @@ class StateBase(ABC):
         self._record_vars = set()
         self._sanity_checks = dict()
 
+        # read-only snapshots of the registries, built lazily and
+        # invalidated whenever a new semantic variable is registered
+        self._sensed_names: Optional[FrozenSet[str]] = None
+        self._actuated_names: Optional[FrozenSet[str]] = None
+        self._sanity_items: Optional[Tuple[Tuple[str, Callable], ...]] = None
+
+    def _invalidate_registry_caches(self) -> None:
+        self._sensed_names = None
+        self._actuated_names = None
+        self._sanity_items = None
+
     @final
-    def get_sensed_prop_names(self) -> Set[str]:
+    def get_sensed_prop_names(self) -> FrozenSet[str]:
         """
         Returns
         -------
-        Set
-            Set containing the identifiers of the sensed variables.
+        FrozenSet
+            Immutable set containing the identifiers of the sensed variables.
+            The same object is returned on every call until a new variable is
+            registered.
         """
-        return copy(self._sensor_vars)
+        if self._sensed_names is None:
+            self._sensed_names = frozenset(self._sensor_vars)
+        return self._sensed_names
 
     @final
-    def get_actuated_prop_names(self) -> Set[str]:
+    def get_actuated_prop_names(self) -> FrozenSet[str]:
         """
         Returns
         -------
-        Set
-            Set containing the identifiers of the actuated variables.
+        FrozenSet
+            Immutable set containing the identifiers of the actuated
+            variables. The same object is returned on every call until a new
+            variable is registered.
         """
-        return copy(self._actuator_vars)
+        if self._actuated_names is None:
+            self._actuated_names = frozenset(self._actuator_vars)
+        return self._actuated_names
 
     @final
     def get_record_variables(self) -> PhyPropMapping:
@@ -147,8 +166,15 @@ class StateBase(ABC):
             failed and their associated values.
         """
 
+        # registered checks don't change once the simulation is running,
+        # so they are snapshotted into a tuple for cheaper iteration
+        items = self._sanity_items
+        if items is None:
+            items = tuple(self._sanity_checks.items())
+            self._sanity_items = items
+
         failed = {}
-        for var, cond in self._sanity_checks.items():
+        for var, cond in items:
             val = getattr(self, var)
             if not cond(val):
                 failed[var] = val
@@ -101,32 +101,34 @@ class SimTicker:
     """
 
     def __init__(self):
+        self._clock_ns = time.monotonic_ns
         self.reset()
 
     def reset(self):
+        # splits are kept as integer nanoseconds, and only converted to
+        # float seconds when handed out
         self._ticks = 0
         self._ticks_at_prev_check = 0
-        self._rate_split = time.monotonic()
-        self._tick_split = None
+        self._rate_split_ns = self._clock_ns()
+        self._tick_split_ns = None
 
     @property
     def total_ticks(self) -> int:
         return self._ticks
 
     def tick(self) -> float:
-        try:
-            self._ticks += 1
-            return 0 if self._tick_split is None \
-                else time.monotonic() - self._tick_split
-        finally:
-            self._tick_split = time.monotonic()
+        now = self._clock_ns()
+        prev = self._tick_split_ns
+        self._tick_split_ns = now
+        self._ticks += 1
+        return 0 if prev is None else (now - prev) * 1e-9
 
     def get_rate(self) -> Rate:
-        try:
-            return Rate(
-                tick_count=self._ticks - self._ticks_at_prev_check,
-                interval_s=time.monotonic() - self._rate_split,
-            )
-        finally:
-            self._ticks_at_prev_check = self._ticks
-            self._rate_split = time.monotonic()
+        now = self._clock_ns()
+        rate = Rate(
+            tick_count=self._ticks - self._ticks_at_prev_check,
+            interval_s=(now - self._rate_split_ns) * 1e-9,
+        )
+        self._ticks_at_prev_check = self._ticks
+        self._rate_split_ns = now
+        return rate
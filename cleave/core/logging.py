@@ -14,7 +14,8 @@
 from typing import Dict
 
 import loguru
-from twisted.logger import ILogObserver, LogLevel, Logger, globalLogPublisher
+from twisted.logger import ILogObserver, LogLevel, Logger, eventAsText, \
+    globalLogPublisher
 from zope.interface import provider
 
 #: This module contains functionality related to logging.
@@ -22,7 +23,7 @@ from zope.interface import provider
 # replace the default handler
 loguru.logger.remove()
 
-__level_mapping = {
+_level_mapping = {
     LogLevel.debug   : loguru.logger.debug,
     LogLevel.info    : loguru.logger.info,
     LogLevel.warn    : loguru.logger.warning,
@@ -30,18 +31,39 @@ __level_mapping = {
     LogLevel.critical: loguru.logger.critical,
 }
 
+# levels which are currently forwarded to loguru
+_active_mapping = dict(_level_mapping)
+
+
+def set_min_level(level: LogLevel) -> None:
+    """
+    Sets the minimum level of the Twisted log events forwarded to loguru.
+    Events below this level are dropped by the bridge before any
+    formatting takes place.
+
+    Parameters
+    ----------
+    level
+        The minimum level of the events to forward.
+    """
+    global _active_mapping
+    _active_mapping = {lvl: fn for lvl, fn in _level_mapping.items()
+                       if lvl >= level}
+
 
 # TODO: improve time handling.
 @provider(ILogObserver)
 def log_to_loguru(event: Dict) -> None:
-    level = event.get('log_level', LogLevel.debug)
-    src = event.get('log_source', '')
-    fmt_str = event.get('log_format', '')
-    timestamp = event.get('log_time', None)
-
-    __level_mapping[level](fmt_str, **event)
+    log_fn = _active_mapping.get(event.get('log_level', LogLevel.debug))
+    if log_fn is not None:
+        # only the formatted text is handed to loguru: the event itself holds
+        # references to loggers and observers which can't be pickled by
+        # enqueued sinks, and loguru must not re-format the message
+        log_fn(eventAsText(event,
+                           includeTimestamp=False,
+                           includeSystem=False))
 
 
 globalLogPublisher.addObserver(log_to_loguru)
 
-__all__ = ['Logger', 'loguru', 'LogLevel']
+__all__ = ['Logger', 'loguru', 'LogLevel', 'set_min_level']
@@ -12,11 +12,11 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 import builtins
+import functools
 import time
 from abc import ABC, abstractmethod
 from pathlib import Path
-from queue import Empty
-from threading import Condition, Event
+from threading import Event, Thread
 from typing import Any, Callable, Optional, Sequence, Set, Tuple, Union
 
 import msgpack
@@ -26,6 +26,7 @@ from twisted.internet.protocol import DatagramProtocol, ProcessProtocol, \
     Protocol
 
 from .protocol import *
+from .protocol import SampleMessage
 from ..logging import Logger
 from ..recordable import CSVRecorder, NamedRecordable, Recordable, Recorder
 from ..util import SingleElementQ
@@ -40,6 +41,10 @@ class BusyControllerException(Exception):
     pass
 
 
+# put in the processing queue to stop the processing loop
+_STOP_PROCESSING = object()
+
+
 # noinspection PyTypeChecker
 class BaseControllerService(Recordable, ABC):
     def __init__(self,
@@ -47,75 +52,73 @@ class BaseControllerService(Recordable, ABC):
                  add_delay_s: float = 0.0):
         super(BaseControllerService, self).__init__()
         self._controller = controller
-        self._busy_cond = Condition()
-        self._busy = False
         self._logger = Logger()
         self._q = SingleElementQ()
         self._running = Event()
         self._running.clear()
         self._add_delay = add_delay_s
+        self._process_thread: Optional[Thread] = None
+        self._sync = controller.process_is_sync
 
         if self._add_delay > 0:
             self._logger.warn(f'Adding {add_delay_s} seconds delay to each '
                               f'control command!')
 
-    def initialize(self):
-        def _process_loop():
-            while self._running.is_set():
-                try:
-                    samples, cb = self._q.pop(timeout=0.1)
-                    results = self._controller.process(samples)
-                    reactor.callFromThread(
-                        reactor.callLater,
-                        self._add_delay,
-                        cb, results)
-                except Empty:
-                    continue
+    def _process_loop(self) -> None:
+        # blocks until there is work to do; shutdown() wakes it up with a
+        # sentinel instead of having it poll the running flag
+        while self._running.is_set():
+            item = self._q.pop()
+            if item is _STOP_PROCESSING:
+                break
+
+            samples, cb = item
+            results = self._controller.process(samples)
+            reactor.callFromThread(
+                reactor.callLater,
+                self._add_delay,
+                cb, results)
 
+    def initialize(self):
         self._running.set()
-        reactor.callInThread(_process_loop)
+        if self._sync:
+            # synchronous controllers are invoked inline on the reactor
+            return
+
+        # the controller runs on its own long-lived thread instead of
+        # occupying a worker in the shared reactor threadpool, so it always
+        # executes on the same thread
+        self._process_thread = Thread(target=self._process_loop,
+                                      name='controller')
+        self._process_thread.start()
 
     def shutdown(self):
         self._running.clear()
+        if self._process_thread is not None:
+            self._q.put(_STOP_PROCESSING)
+            self._process_thread.join()
+            self._process_thread = None
 
     def process_sensor_samples(self,
                                samples: PhyPropMapping,
                                success_cb: Callable[[PhyPropMapping], Any]) \
             -> None:
 
+        if self._sync:
+            # fast path, no thread hand-off
+            results = self._controller.process(samples)
+            if self._add_delay > 0:
+                reactor.callLater(self._add_delay, success_cb, results)
+            else:
+                success_cb(results)
+            return
+
         # put call in queue
+        # the controller is only ever invoked from the single processing
+        # loop, so samples arriving while it is busy simply replace each
+        # other in the queue and no additional locking is needed
         self._q.put((samples, success_cb))
 
-        # def process() -> PhyPropMapping:
-        #     with self._busy_cond:
-        #         if self._busy:
-        #             raise BusyControllerException()
-        #         self._busy = True
-        #
-        #     try:
-        #         return self._controller.process(samples)
-        #     finally:
-        #         with self._busy_cond:
-        #             self._busy = False
-        #
-        # def errback(fail: Failure) -> None:
-        #     try:
-        #         fail.trap()
-        #     except BusyControllerException:
-        #         self._logger.warn('Controller is busy, discarding received '
-        #                           'samples.')
-        #     except Exception as e:
-        #         self._logger.error('Error encountered while processing '
-        #                            'samples.')
-        #         self._logger.error(fail.getTraceback())
-        #
-        # # in case the controller is busy, don't return anything
-        # # don't return anything if there's an error in processing either
-        # deferred = deferToThread(process)
-        # deferred.addCallback(success_cb)
-        # deferred.addErrback(errback)
-        # return deferred
-
     @property
     @abstractmethod
     def protocol(self) -> Union[Protocol, ProcessProtocol, DatagramProtocol]:
@@ -157,6 +160,11 @@ class UDPControllerService(BaseControllerService, DatagramProtocol):
 
         self._recorder = CSVRecorder(self, self._out_dir, 'service')
 
+        # callables used on every datagram, bound once; the transport is
+        # only available after the protocol has been started
+        self._debug = self._logger.debug
+        self._write: Optional[Callable[[bytes, Tuple[str, int]], None]] = None
+
     @property
     def recorders(self) -> Set[Recorder]:
         return self._records.recorders
@@ -167,6 +175,7 @@ class UDPControllerService(BaseControllerService, DatagramProtocol):
 
     def startProtocol(self) -> None:
         self._logger.info('Started controller service...')
+        self._write = self.transport.write
         self.initialize()
         self._recorder.initialize()
 
@@ -178,6 +187,46 @@ class UDPControllerService(BaseControllerService, DatagramProtocol):
         self.shutdown()
         self._recorder.shutdown()
 
+    def _send_reply(self,
+                    in_msg: SampleMessage,
+                    addr: Tuple[str, int],
+                    recv_time: float,
+                    in_size: int,
+                    act_cmds: Optional[PhyPropMapping]) -> None:
+        """
+        Sends the actuation commands produced by the controller back to the
+        plant and records the exchange.
+        """
+        if act_cmds is None:
+            return
+
+        send_time = time.time()
+        out_dgram = self._msg_fact.serialize_control_reply(
+            in_msg, act_cmds, send_time)
+        out_size = len(out_dgram)
+        try:
+            self._write(out_dgram, addr)
+        except builtins.BlockingIOError:
+            # Handles bug https://twistedmatrix.com/trac/ticket/2790
+            # in twisted, where EWOULDBLOCK or EAGAIN are raised
+            # when the UDP socket buffer is full.
+            # Simply ignoring the datagram works, since UDP doesn't
+            # provide any guarantees anyway.
+            self._logger.warn('Full UDP socket buffer, silently '
+                              'dropping datagram.')
+        self._debug(
+            'Sent command to {addr[0]}:{addr[1]} ({b} bytes).',
+            addr=addr, b=out_size)
+
+        self._records.push_record(
+            seq=in_msg.seq,
+            recv_timestamp=recv_time,
+            recv_size=in_size,
+            process_time=send_time - recv_time,
+            send_timestamp=send_time,
+            send_size=out_size
+        )
+
     def datagramReceived(self, in_dgram: bytes, addr: Tuple[str, int]):
         """
         Executed on each datagram received.
@@ -189,45 +238,28 @@ class UDPControllerService(BaseControllerService, DatagramProtocol):
         #  that come in while the controller is busy)
         recv_time = time.time()
         in_size = len(in_dgram)
-        self._logger.debug('Received {b} bytes from {addr[0]}:{addr[1]}...',
-                           b=in_size, addr=addr)
+        self._debug('Received {b} bytes from {addr[0]}:{addr[1]}...',
+                    b=in_size, addr=addr)
+
+        if not self._msg_fact.is_control_message(in_dgram):
+            self._logger.warn(
+                'Ignoring malformed datagram from {addr[0]}:{addr[1]}',
+                addr=addr
+            )
+            return
 
         try:
             in_msg = self._msg_fact.parse_message_from_bytes(in_dgram)
-            if in_msg.msg_type == ControlMsgType.SENSOR_SAMPLE:
+            if in_msg.msg_type is ControlMsgType.SENSOR_SAMPLE:
                 self._logger.info('Got control request.')
 
-                def result_callback(act_cmds: Optional[PhyPropMapping]) -> None:
-                    if act_cmds is None:
-                        return
-
-                    out_msg = in_msg.make_control_reply(act_cmds)
-                    out_dgram = out_msg.serialize()
-                    out_size = len(out_dgram)
-                    try:
-                        self.transport.write(out_dgram, addr)
-                    except builtins.BlockingIOError:
-                        # Handles bug https://twistedmatrix.com/trac/ticket/2790
-                        # in twisted, where EWOULDBLOCK or EAGAIN are raised
-                        # when the UDP socket buffer is full.
-                        # Simply ignoring the datagram works, since UDP doesn't
-                        # provide any guarantees anyway.
-                        self._logger.warn('Full UDP socket buffer, silently '
-                                          'dropping datagram.')
-                    self._logger.debug(
-                        'Sent command to {addr[0]}:{addr[1]} ({b} bytes).',
-                        addr=addr, b=out_size)
-
-                    self._records.push_record(
-                        seq=in_msg.seq,
-                        recv_timestamp=recv_time,
-                        recv_size=in_size,
-                        process_time=out_msg.timestamp - recv_time,
-                        send_timestamp=out_msg.timestamp,
-                        send_size=out_size
-                    )
-
-                self.process_sensor_samples(in_msg.payload, result_callback)
+                # partial objects are cheaper to build than a new closure on
+                # every datagram
+                self.process_sensor_samples(
+                    in_msg.payload,
+                    functools.partial(self._send_reply,
+                                      in_msg, addr, recv_time, in_size)
+                )
             else:
                 self._logger.warn(f'Ignoring message of unrecognized type '
                                   f'{in_msg.msg_type.name}.')
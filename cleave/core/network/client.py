@@ -16,11 +16,11 @@ from __future__ import annotations
 
 import builtins
 import json
+import random
 import time
 from abc import ABC, abstractmethod
 from pathlib import Path
-from queue import Empty
-from typing import Any, Mapping, Tuple
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 import msgpack
 import numpy as np
@@ -38,7 +38,6 @@ from ..client.control import BaseControllerInterface
 from ..logging import Logger
 from ..recordable import CSVRecorder, NamedRecordable
 from ...api.util import PhyPropMapping
-from ...core.util import SingleElementQ
 
 
 class RecordingUDPControlClient(DatagramProtocol, ABC):
@@ -47,10 +46,13 @@ class RecordingUDPControlClient(DatagramProtocol, ABC):
                  controller_addr: Tuple[str, int],
                  output_dir: Path):
         super(RecordingUDPControlClient, self).__init__()
-        self._recv_q = SingleElementQ()
+        # latest actuation commands received from the controller; only ever
+        # accessed from the reactor thread, so no synchronization is needed
+        self._latest_cmds: Optional[PhyPropMapping] = None
         self._caddr = controller_addr
         self._msg_fact = ControlMessageFactory()
-        self._waiting_for_reply = {}
+        # seq -> (send timestamp, size in bytes) of unanswered messages
+        self._waiting_for_reply: Dict[int, Tuple[float, int]] = {}
         self._log = Logger()
 
         self._records = NamedRecordable(
@@ -75,64 +77,42 @@ class RecordingUDPControlClient(DatagramProtocol, ABC):
     def startProtocol(self):
         self._recorder.initialize()
 
-        # build a controller interface
-        class ControllerInterface(BaseControllerInterface):
-            proto = self
-
-            def put_sensor_values(self, prop_values: PhyPropMapping) -> None:
-                msg = self.proto._msg_fact.create_sensor_message(prop_values)
-                payload = msg.serialize()
-                # this should always be called from the reactor thread
-                try:
-                    self.proto.transport.write(payload, self.proto._caddr)
-                except builtins.BlockingIOError:
-                    # Handles bug https://twistedmatrix.com/trac/ticket/2790
-                    # in twisted, where EWOULDBLOCK or EAGAIN are raised when
-                    # the UDP socket buffer is full.
-                    # Simply ignoring the datagram works, since UDP doesn't
-                    # provide any guarantees anyway.
-                    self.proto._log.warn('Full UDP socket buffer, silently '
-                                         'dropping datagram.')
-                self.proto._waiting_for_reply[msg.seq] = {'msg' : msg,
-                                                          'size': len(payload)}
-
-            def get_actuator_values(self) -> PhyPropMapping:
-                try:
-                    return self.proto._recv_q.pop_nowait()
-                except Empty:
-                    return dict()
-
         self._log.info(f'UDP client listening and ready.')
-        self.on_start(ControllerInterface())
+        self.on_start(_UDPControllerInterface(self))
 
     def stopProtocol(self):
         self.on_end()
         self._log.info('Recording messages that never got a reply...')
-        for _, out in self._waiting_for_reply.items():
+        for seq, (send_time, send_size) in self._waiting_for_reply.items():
             self._records.push_record(
-                seq=out['msg'].seq,
-                send_timestamp=out['msg'].timestamp,
-                send_size=out['size']
+                seq=seq,
+                send_timestamp=send_time,
+                send_size=send_size
             )
         self._recorder.shutdown()
 
     def datagramReceived(self, datagram: bytes, addr: Tuple[str, int]):
         # unpack commands
         recv_time = time.time()
+        if not self._msg_fact.is_control_message(datagram):
+            self._log.warn('Ignoring malformed datagram from {}:{}.'
+                           .format(*addr))
+            return
+
         try:
             msg = self._msg_fact.parse_message_from_bytes(datagram)
-            out = self._waiting_for_reply.pop(msg.seq)
+            send_time, send_size = self._waiting_for_reply.pop(msg.seq)
 
             self._records.push_record(
-                seq=out['msg'].seq,
-                send_timestamp=out['msg'].timestamp,
-                send_size=out['size'],
+                seq=msg.seq,
+                send_timestamp=send_time,
+                send_size=send_size,
                 recv_timestamp=recv_time,
                 recv_size=len(datagram),
-                rtt=recv_time - out['msg'].timestamp
+                rtt=recv_time - send_time
             )
 
-            self._recv_q.put(msg.payload)
+            self._latest_cmds = msg.payload
         except NoMessage:
             pass
         except KeyError:
@@ -144,6 +124,41 @@ class RecordingUDPControlClient(DatagramProtocol, ABC):
         reactor.listenUDP(0, self)
 
 
+class _UDPControllerInterface(BaseControllerInterface):
+    """
+    Controller interface handed to the plant by RecordingUDPControlClient.
+    Should only ever be used from the reactor thread.
+    """
+
+    def __init__(self, proto: RecordingUDPControlClient):
+        super(_UDPControllerInterface, self).__init__()
+        self._proto = proto
+
+    def put_sensor_values(self, prop_values: PhyPropMapping) -> None:
+        proto = self._proto
+        seq, timestamp, payload = \
+            proto._msg_fact.serialize_sensor_message(prop_values)
+        try:
+            proto.transport.write(payload, proto._caddr)
+        except builtins.BlockingIOError:
+            # Handles bug https://twistedmatrix.com/trac/ticket/2790
+            # in twisted, where EWOULDBLOCK or EAGAIN are raised when
+            # the UDP socket buffer is full.
+            # Simply ignoring the datagram works, since UDP doesn't
+            # provide any guarantees anyway.
+            proto._log.warn('Full UDP socket buffer, silently '
+                            'dropping datagram.')
+        proto._waiting_for_reply[seq] = (timestamp, len(payload))
+
+    def get_actuator_values(self) -> PhyPropMapping:
+        proto = self._proto
+        cmds = proto._latest_cmds
+        if cmds is None:
+            return dict()
+        proto._latest_cmds = None
+        return cmds
+
+
 # noinspection PyPep8Naming
 @implementer(IBodyProducer)
 class JSONProducer:
@@ -168,16 +183,45 @@ class JSONProducer:
         pass
 
 
+class ControllerNotReadyError(Exception):
+    pass
+
+
 class DispatcherClient:
     def __init__(self,
                  reactor: PosixReactorBase,
                  host: str,
-                 port: int):
+                 port: int,
+                 max_ready_retries: int = 20,
+                 retry_base_delay_s: float = 0.1,
+                 retry_max_delay_s: float = 5.0):
+        """
+        Parameters
+        ----------
+        reactor
+            The Twisted reactor to use for requests.
+        host
+            Address of the dispatcher.
+        port
+            Port of the dispatcher.
+        max_ready_retries
+            Maximum number of times to poll a spawned controller which is
+            not yet ready before giving up.
+        retry_base_delay_s
+            Delay before the first retry. Subsequent retries back off
+            exponentially, with random jitter.
+        retry_max_delay_s
+            Upper bound for the delay between retries, before jitter.
+        """
         self._dispatcher_addr = f'http://{host}:{port}'
         self._reactor = reactor
         self._agent = Agent(reactor)
         self._log = Logger()
 
+        self._max_retries = max_ready_retries
+        self._retry_base_delay = retry_base_delay_s
+        self._retry_max_delay = retry_max_delay_s
+
     @property
     def dispatcher_address(self) -> str:
         return self._dispatcher_addr
@@ -209,13 +253,24 @@ class DispatcherClient:
             self._log.info(f'New controller listening on {host}:{port}.')
             return controller_info
 
-        def info_callback(response: Response):
+        def info_callback(response: Response, attempt: int = 0):
             if response.code == 200:
                 d = readBody(response)
                 d.addCallback(got_info)
             elif response.code == 202:
                 # controller not yet ready
-                self._log.info('Controller is not yet ready, retrying!')
+                if attempt >= self._max_retries:
+                    raise ControllerNotReadyError(
+                        f'Controller at {response.request.absoluteURI} '
+                        f'not ready after {attempt} retries.')
+
+                # back off exponentially, with jitter, instead of polling
+                # the dispatcher at a fixed rate
+                delay = min(self._retry_base_delay * (2 ** attempt),
+                            self._retry_max_delay)
+                delay *= 0.5 + random.random()
+                self._log.info('Controller is not yet ready, retrying in '
+                               f'{delay:0.2f} seconds!')
 
                 # use callLater to wait a bit
                 def retry():
@@ -224,10 +279,10 @@ class DispatcherClient:
                         uri=response.request.absoluteURI,
                         headers=None, bodyProducer=None
                     )
-                    d.addCallback(info_callback)
+                    d.addCallback(info_callback, attempt=attempt + 1)
                     return d
 
-                d = task.deferLater(self._reactor, 0.1, retry)
+                d = task.deferLater(self._reactor, delay, retry)
             else:
                 raise AssertionError()  # TODO: change error type
             return d
@@ -16,12 +16,11 @@ from __future__ import annotations
 
 import abc
 import time
-from dataclasses import asdict, dataclass
 from enum import Enum, auto
-from typing import Any, Dict, Mapping, Optional, Union
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
 
 import msgpack
-import msgpack_numpy as m
+import numpy as np
 
 from ...api.util import PhyPropType
 
@@ -31,56 +30,117 @@ from ...api.util import PhyPropType
 __all__ = ['ControlMsgType', 'ControlMessage', 'ControlMessageFactory',
            'NoMessage']
 
-# patch msgpack for numpy
-m.patch()
-
-
 class ControlMsgType(Enum):
     SENSOR_SAMPLE = auto()
     ACTUATION_CMD = auto()
 
 
-# custom (de)serialization functions to handle message types
+# msgpack extension type code used to encode numpy arrays
+_NDARRAY_EXT_CODE = 0x20
+
+
+def _pack_ndarray(array: np.ndarray) -> msgpack.ExtType:
+    # extension data is a length-prefixed (dtype descr, shape) header
+    # followed by the raw array contents; the descr of plain dtypes is simply
+    # their type string, while structured dtypes keep their field layout
+    header = msgpack.packb((np.lib.format.dtype_to_descr(array.dtype),
+                            array.shape))
+    if not array.flags.c_contiguous:
+        array = np.ascontiguousarray(array)
+    return msgpack.ExtType(_NDARRAY_EXT_CODE,
+                           len(header).to_bytes(2, 'big') + header
+                           + array.data)
+
+
+def _descr_from_header(descr: Any) -> Any:
+    # msgpack decodes tuples as lists, but field titles and subarray shapes
+    # in structured dtype descrs need to be tuples
+    if isinstance(descr, str):
+        return descr
+    return [(tuple(name) if isinstance(name, list) else name,
+             _descr_from_header(fmt),
+             *(tuple(shape) for shape in rest))
+            for name, fmt, *rest in descr]
+
+
+def _unpack_ndarray(data: bytes) -> np.ndarray:
+    header_len = int.from_bytes(data[:2], 'big') + 2
+    descr, shape = msgpack.unpackb(data[2:header_len])
+    dtype = np.lib.format.descr_to_dtype(_descr_from_header(descr))
+    return np.frombuffer(data, dtype=dtype, offset=header_len) \
+        .reshape(tuple(shape))
+
+
+# custom (de)serialization functions to handle numpy values; message types
+# are sent as plain integers and converted back when parsing, so they don't
+# need any special handling here
 def _serialize(obj: Any) -> Any:
-    if isinstance(obj, ControlMsgType):
-        return {'__msgtype__': obj.value}
+    if isinstance(obj, np.ndarray):
+        if obj.dtype.hasobject:
+            raise TypeError('Cannot serialize numpy arrays of objects.')
+        return _pack_ndarray(obj)
+    elif isinstance(obj, np.generic):
+        # numpy scalars are sent as the equivalent builtin values
+        return obj.item()
     return obj
 
 
-def _deserialize(obj: Dict) -> Any:
-    if '__msgtype__' in obj:
-        return ControlMsgType(obj['__msgtype__'])
-    return obj
+def _ext_hook(code: int, data: bytes) -> Any:
+    if code == _NDARRAY_EXT_CODE:
+        return _unpack_ndarray(data)
+    return msgpack.ExtType(code, data)
 
 
-# module-local packer and unpacker objects with some sane defaults
+# module-local packer object with some sane defaults, kept for the lifetime
+# of the process instead of being rebuilt on every message
 _packer = msgpack.Packer(
-    default=_serialize
-)
-_unpacker = msgpack.Unpacker(
-    timestamp=0,
-    object_hook=_deserialize,
+    default=_serialize,
+    use_bin_type=True,
+    autoreset=True,
 )
 
 
+# control messages are always encoded as msgpack maps, so the first byte of
+# any well-formed datagram is one of the map type tags (fixmap, map16, map32)
+_MAP_HEADER_BYTES = frozenset(range(0x80, 0x90)) | {0xde, 0xdf}
+
+
 class NoMessage(Exception):
     pass
 
 
-@dataclass
 class ControlMessage(abc.ABC):
-    msg_type: ControlMsgType
-    seq: int
-    timestamp: float
-    payload: Any
+    __slots__ = ('msg_type', 'seq', 'timestamp', 'payload')
+
+    def __init__(self,
+                 msg_type: ControlMsgType,
+                 seq: int,
+                 timestamp: float,
+                 payload: Any):
+        self.msg_type = msg_type
+        self.seq = seq
+        self.timestamp = timestamp
+        self.payload = payload
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(msg_type={self.msg_type!r}, ' \
+               f'seq={self.seq!r}, timestamp={self.timestamp!r}, ' \
+               f'payload={self.payload!r})'
 
     def serialize(self) -> bytes:
-        package = asdict(self)
-        return _packer.pack(package)
+        # built directly instead of through dataclasses.asdict(), which would
+        # recursively copy the payload only for msgpack to walk it again
+        return _packer.pack({
+            'msg_type' : self.msg_type.value,
+            'seq'      : self.seq,
+            'timestamp': self.timestamp,
+            'payload'  : self.payload,
+        })
 
 
-@dataclass
 class ActuationMessage(ControlMessage):
+    __slots__ = ()
+
     def __init__(self,
                  seq: int,
                  payload: Mapping[str, PhyPropType],
@@ -93,8 +153,9 @@ class ActuationMessage(ControlMessage):
         )
 
 
-@dataclass
 class SampleMessage(ControlMessage):
+    __slots__ = ()
+
     def __init__(self,
                  seq: int,
                  payload: Mapping[str, PhyPropType],
@@ -114,16 +175,46 @@ class SampleMessage(ControlMessage):
         )
 
 
+# keyed on the message type values used on the wire
 _msg_type_map = {
-    ControlMsgType.SENSOR_SAMPLE: SampleMessage,
-    ControlMsgType.ACTUATION_CMD: ActuationMessage
+    ControlMsgType.SENSOR_SAMPLE.value: SampleMessage,
+    ControlMsgType.ACTUATION_CMD.value: ActuationMessage
 }
 
 
+def _make_template(msg_type: ControlMsgType) -> Dict[str, Any]:
+    # same keys, in the same order, as ControlMessage.serialize() produces
+    return {
+        'msg_type' : msg_type.value,
+        'seq'      : 0,
+        'timestamp': 0.0,
+        'payload'  : None,
+    }
+
+
+def _pack_template(template: Dict[str, Any],
+                   seq: int,
+                   timestamp: float,
+                   payload: Any) -> bytes:
+    template['seq'] = seq
+    template['timestamp'] = timestamp
+    template['payload'] = payload
+    try:
+        return _packer.pack(template)
+    finally:
+        # don't keep the payload alive until the next message
+        template['payload'] = None
+
+
 class ControlMessageFactory:
     def __init__(self):
         self._msg_count = 0
 
+        # messages of each type share the same shape, so a single mapping
+        # per type is refilled and packed instead of building message objects
+        self._sample = _make_template(ControlMsgType.SENSOR_SAMPLE)
+        self._reply = _make_template(ControlMsgType.ACTUATION_CMD)
+
     def reset(self):
         self._msg_count = 0
 
@@ -142,20 +233,101 @@ class ControlMessageFactory:
         self._msg_count += 1
         return msg
 
+    def serialize_sensor_message(self, data: Mapping[str, PhyPropType]) \
+            -> Tuple[int, float, bytes]:
+        """
+        Creates and directly serializes a new sensor sample message,
+        equivalent to create_sensor_message(data).serialize() but without
+        creating an intermediate message object. Not thread-safe.
+
+        Parameters
+        ----------
+        data
+            Sensor values to include in the message.
+
+        Returns
+        -------
+        Tuple[int, float, bytes]
+            The sequence number and timestamp assigned to the message,
+            and the serialized message.
+        """
+        seq = self._msg_count
+        timestamp = time.time()
+        packed = _pack_template(self._sample, seq, timestamp, data)
+
+        self._msg_count = seq + 1
+        return seq, timestamp, packed
+
+    def serialize_control_reply(self,
+                                request: SampleMessage,
+                                act_cmd: Mapping[str, PhyPropType],
+                                timestamp: float) -> bytes:
+        """
+        Directly serializes the actuation reply to a sensor sample message,
+        equivalent to request.make_control_reply(act_cmd).serialize() but
+        without creating an intermediate message object. Not thread-safe.
+
+        Parameters
+        ----------
+        request
+            The sensor sample message to reply to.
+        act_cmd
+            Actuation commands to send in the reply.
+        timestamp
+            Timestamp of the reply.
+
+        Returns
+        -------
+        bytes
+            The serialized reply.
+        """
+        return _pack_template(self._reply, request.seq, timestamp, act_cmd)
+
+    @staticmethod
+    def is_control_message(data: bytes) -> bool:
+        """
+        Cheap check on the header of a datagram, used to discard malformed
+        input before handing it to the unpacker.
+
+        Parameters
+        ----------
+        data
+            Raw datagram contents.
+
+        Returns
+        -------
+        bool
+            False if the data definitely does not contain a control message,
+            True if it might.
+        """
+        return len(data) > 0 and data[0] in _MAP_HEADER_BYTES
+
     @staticmethod
     def parse_message_from_bytes(data: bytes) -> Union[ActuationMessage,
                                                        SampleMessage]:
-        _unpacker.feed(data)
-        try:
-            deser = next(_unpacker)
-
-            cls = _msg_type_map[deser['msg_type']]
-            return cls(seq=deser['seq'],
-                       timestamp=deser['timestamp'],
-                       payload=deser['payload'])
-        except StopIteration:
+        if not data:
             raise NoMessage()
 
+        # each datagram holds exactly one complete message, so it can be
+        # unpacked in one go instead of going through a streaming unpacker;
+        # truncated or trailing data raises a ValueError
+        deser = msgpack.unpackb(
+            data,
+            timestamp=0,
+            ext_hook=_ext_hook,
+            raw=False,
+            # payloads only contain scalar values, so arrays can be decoded
+            # as tuples, which are cheaper to build than lists
+            use_list=False,
+        )
+
+        cls = _msg_type_map.get(deser['msg_type'])
+        if cls is None:
+            raise ValueError(f'Unknown message type {deser["msg_type"]!r}.')
+        return cls(seq=deser['seq'],
+                   timestamp=deser['timestamp'],
+                   payload=deser['payload'])
+
 
 class ProtocolWarning(Warning):
     pass
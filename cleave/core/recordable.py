@@ -26,18 +26,24 @@
 from __future__ import annotations
 
 import abc
+import csv
 import os
 import threading
 from collections import namedtuple
 from datetime import datetime
 from pathlib import Path
-from queue import Empty, Queue
-from typing import Any, Mapping, NamedTuple, Sequence, Set
+from queue import Queue
+from typing import Any, List, Mapping, NamedTuple, Sequence, Set
 
-import numpy as np
-import pandas as pd
+from twisted.internet.task import LoopingCall
 
-from .logging import Logger
+from .logging import Logger, LogLevel
+
+# put in the chunk queue to stop CSVRecorder writer threads
+_STOP_WRITING = object()
+
+# size of the file buffer used by CSVRecorder writer threads
+_WRITE_BUFFER_SIZE = 1 << 20
 
 
 class Recorder(abc.ABC):
@@ -127,13 +133,22 @@ class NamedRecordable(Recordable):
 class CSVRecorder(Recorder):
     """
     Implementation of a CSV-file backed Recorder.
+
+    Records are buffered in memory and handed off in batches to a writer
+    thread, either when the buffer reaches chunk_size records or every
+    flush_interval_s seconds, whichever comes first. At most
+    max_pending_chunks batches are queued for writing; if the writer falls
+    behind, flushing blocks until it catches up. If writing fails, the error
+    is logged and any further records are dropped.
     """
 
     def __init__(self,
                  recordable: Recordable,
                  output_dir: Path,
                  metric_name: str,
-                 chunk_size: int = 1000):
+                 chunk_size: int = 1000,
+                 flush_interval_s: float = 0.5,
+                 max_pending_chunks: int = 4):
         # TODO: maybe add timestamp??
         super(CSVRecorder, self).__init__(recordable)
 
@@ -157,77 +172,85 @@ class CSVRecorder(Recorder):
                      f'{metric_name}{name_suffix}' \
                      f'{datetime.now():%Y%m%d.%H%M%S%f}.csv'
 
-        dummy_data = np.empty((chunk_size, len(recordable.record_fields)))
-        self._table_chunk = pd.DataFrame(data=dummy_data,
-                                         columns=recordable.record_fields)
-        self._chunk_count = 0
-        self._chunk_row_idx = 0
+        self._chunk_size = chunk_size
+        self._chunk: List[NamedTuple] = []
 
-        self._chunk_q = Queue()
+        self._flush_interval = flush_interval_s
+        self._flush_loop = LoopingCall(self.flush)
+
+        self._chunk_q = Queue(maxsize=max_pending_chunks)
         self._chunk_write_thread = threading.Thread(
             target=self._writer_loop, args=(self._path,))
-        self._shutdown_event = threading.Event()
 
     def _writer_loop(self, path: Path) -> None:
-        with path.open('wb') as fp:
-            # "touch" the file to clear it and prepare for actual writing
-            fp.write(bytes(0x00))
-
-        with path.open('a', newline='') as fp:
-            while not self._shutdown_event.is_set():
-                try:
-                    chunk, with_hdr = self._chunk_q.get(block=True,
-                                                        timeout=0.05)
-                except Empty:
-                    continue
-
-                chunk.to_csv(fp, header=with_hdr, index=False)
-                self._chunk_q.task_done()
-
-            # this only occurs at shutdown, so there shouldn't be any new
-            # chunks coming in
-            while not self._chunk_q.empty():
-                chunk, with_hdr = self._chunk_q.get_nowait()
-                chunk.to_csv(fp, header=with_hdr, index=False)
-                self._chunk_q.task_done()
+        stopped = False
+        try:
+            # the file is opened (and truncated) once for the whole run, with
+            # a buffer large enough to hold a full chunk of records
+            with path.open('w', newline='',
+                           buffering=_WRITE_BUFFER_SIZE) as fp:
+                writer = csv.writer(fp)
+                writer.writerow(self._recordable.record_fields)
+                fp.flush()
+
+                while True:
+                    chunk = self._chunk_q.get()
+                    try:
+                        if chunk is _STOP_WRITING:
+                            stopped = True
+                            break
+                        writer.writerows(chunk)
+                        fp.flush()
+                    finally:
+                        self._chunk_q.task_done()
+        except Exception:
+            self._log.failure(f'Could not write records to {path}, further '
+                              f'records will be dropped.',
+                              level=LogLevel.error)
+
+        # flushes happen on the reactor thread and block while the chunk
+        # queue is full, so keep draining it until shutdown even if writing
+        # failed
+        while not stopped:
+            stopped = self._chunk_q.get() is _STOP_WRITING
+            self._chunk_q.task_done()
 
     def initialize(self) -> None:
         self._log.info(f'Initializing CSVRecorder on {self._path}.')
         # initialize the writing thread
-        self._shutdown_event.clear()
         while self._chunk_q.qsize() > 0:
             self._chunk_q.get_nowait()
         self._chunk_write_thread.start()
+        self._flush_loop.start(interval=self._flush_interval, now=False)
 
     def flush(self) -> None:
         """
         Flushes the internal record buffer to the backing CSV file.
         """
 
-        self._chunk_q.put((
-            (self._table_chunk.iloc[:self._chunk_row_idx].copy()),
-            self._chunk_count == 0))
-
-        self._chunk_row_idx = 0
-        self._chunk_count += 1
+        if len(self._chunk) == 0:
+            return
 
-        return
+        # the writer thread takes ownership of the current buffer
+        self._chunk_q.put(self._chunk)
+        self._chunk = []
 
     def notify(self, latest_record: NamedTuple) -> None:
-        self._table_chunk.iloc[self._chunk_row_idx] = \
-            pd.Series(latest_record._asdict())
-        self._chunk_row_idx += 1
+        self._chunk.append(latest_record)
 
-        if self._chunk_row_idx == self._table_chunk.shape[0]:
+        if len(self._chunk) >= self._chunk_size:
             # flush to disk
             self.flush()
 
     def shutdown(self) -> None:
         self._log.info(f'Flushing and closing CSV table writer on path '
                        f'{self._path}...')
+        if self._flush_loop.running:
+            self._flush_loop.stop()
         self.flush()
-        self._shutdown_event.set()
-        self._chunk_q.join()
+        # chunks are written in order, so the sentinel is only reached once
+        # all pending chunks have been written
+        self._chunk_q.put(_STOP_WRITING)
         self._chunk_write_thread.join()
         self._chunk_write_thread = threading.Thread(
             target=self._writer_loop, args=(self._path,))
@@ -1,5 +1,7 @@
+import time
+from collections import deque
 from queue import Empty
-from threading import Condition
+from threading import Event
 from typing import Any, Optional
 
 
@@ -15,9 +17,11 @@ class SingleElementQ:
     """
 
     def __init__(self):
-        self._value = None
-        self._has_value = False
-        self._cond = Condition()
+        # deque.append() and deque.popleft() are atomic, so the slot itself
+        # needs no lock and pop_nowait() is lock-free; put() still takes the
+        # event's internal lock when setting it to wake up blocking pops
+        self._slot = deque(maxlen=1)
+        self._available = Event()
 
     def put(self, value: Any) -> None:
         """
@@ -29,10 +33,8 @@ class SingleElementQ:
             The value to store in this container.
 
         """
-        with self._cond:
-            self._value = value
-            self._has_value = True
-            self._cond.notify()
+        self._slot.append(value)
+        self._available.set()
 
     def pop(self, timeout: Optional[float] = None) -> Any:
         """
@@ -57,15 +59,27 @@ class SingleElementQ:
             If timeout is not None and no value is available when it runs out.
 
         """
-        with self._cond:
-            while not self._has_value:
-                if not self._cond.wait(timeout=timeout):
-                    raise Empty()
-
-            out = self._value
-            self._value = None
-            self._has_value = False
-            return out
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                return self._slot.popleft()
+            except IndexError:
+                pass
+
+            # clear the event and check again, so that a put() happening
+            # in between is not missed
+            self._available.clear()
+            try:
+                return self._slot.popleft()
+            except IndexError:
+                pass
+
+            remaining = None if deadline is None \
+                else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise Empty()
+            elif not self._available.wait(timeout=remaining):
+                raise Empty()
 
     def pop_nowait(self) -> Any:
         """
@@ -83,11 +97,7 @@ class SingleElementQ:
             If no value for the stored variable exists.
 
         """
-        with self._cond:
-            if not self._has_value:
-                raise Empty()
-            else:
-                out = self._value
-                self._value = None
-                self._has_value = False
-                return out
+        try:
+            return self._slot.popleft()
+        except IndexError:
+            raise Empty()
@@ -13,8 +13,8 @@
 #  limitations under the License.
 
 import math
-from multiprocessing import Event, Queue
-from queue import Empty, Full
+from multiprocessing import Array, Event
+from typing import Any, Mapping
 
 import numpy as np
 import pymunk
@@ -28,7 +28,8 @@ from ..api.util import PhyPropMapping
 G_CONST = Vec2d(0, -9.8)
 
 
-def visualization_loop(input_q: Queue,
+def visualization_loop(geometry: Mapping[str, Any],
+                       body_poses: Array,
                        shutdown_event: Event,
                        window_w: int,
                        window_h: int,
@@ -40,9 +41,13 @@ def visualization_loop(input_q: Queue,
 
     Parameters
     ----------
-    input_q
-        Input queue which holds dictionaries describing the figures to be
-        drawn on screen.
+    geometry
+        Dictionary describing the static geometry of the figures to be drawn
+        on screen. Shapes are given in body coordinates, together with the
+        index of the body they belong to.
+    body_poses
+        Shared array holding the latest position (x, y) and angle of each
+        body, updated by the simulation.
     shutdown_event
         Event to signal a shutdown of the Plant.
     window_w
@@ -65,24 +70,19 @@ def visualization_loop(input_q: Queue,
     floor_offset = Vec2d(window_w / 2, 5)  # TODO fix magic number
 
     def on_draw(dt):
-        # TODO: needs a timeout for shutdown
-        while True:
-            if shutdown_event.is_set():
-                window.close()
-                pyglet.app.exit()
-                return
-
-            try:
-                coord_dict = input_q.get(block=True, timeout=0.01)
-                break
-            except Empty:
-                continue
+        if shutdown_event.is_set():
+            window.close()
+            pyglet.app.exit()
+            return
+
+        # slicing the synchronized array takes its lock, so this is a
+        # consistent snapshot of all body poses
+        poses = body_poses[:]
 
         window.clear()
-        for shape in coord_dict['shapes']:
-            raw_vertices = shape['vertices']
-            angle = shape['angle']
-            position = shape['position']
+        for body_idx, raw_vertices in geometry['shapes']:
+            x, y, angle = poses[3 * body_idx:3 * body_idx + 3]
+            position = Vec2d(x, y)
             # get vertices in world coordinates
             vertices = [Vec2d(*v).rotated(angle) + position for v in
                         raw_vertices]
@@ -99,7 +99,7 @@ def visualization_loop(input_q: Queue,
                                  pyglet.gl.GL_LINE_LOOP,
                                  data)
 
-        for line in coord_dict['lines']:
+        for line in geometry['lines']:
             raw_vertices = line['vertices']
             radius = line['radius']
             vertices = [Vec2d(*v) + (0, radius) for v in raw_vertices]
@@ -284,12 +284,31 @@ class InvPendulumStateWithViz(InvPendulumState):
             pend_moment=pend_moment,
         )
 
-        self._coord_q = Queue(maxsize=1)
+        # body shapes and the ground don't change during the simulation, so
+        # they are sent to the drawing process once, and only the body poses
+        # are shared afterwards
+        self._viz_bodies = (self._cart_body, self._pend_body)
+        geometry = {
+            'shapes': [
+                (i, [(v.x, v.y) for v in shape.get_vertices()])
+                for i, body in enumerate(self._viz_bodies)
+                for shape in body.shapes
+            ],
+            'lines' : [{
+                'radius'  : line.radius,
+                'vertices': ((line.a.x, line.a.y), (line.b.x, line.b.y)),
+            } for line in (self._ground,)],
+        }
+
+        # x, y and angle for each body
+        self._body_poses = Array('d', 3 * len(self._viz_bodies))
+        self._publish_poses()
         self._shutdown_event = Event()
 
         self._draw_proc = Process(target=visualization_loop,
                                   kwargs=dict(
-                                      input_q=self._coord_q,
+                                      geometry=geometry,
+                                      body_poses=self._body_poses,
                                       shutdown_event=self._shutdown_event,
                                       window_w=window_w,
                                       window_h=window_h,
@@ -311,30 +330,14 @@ class InvPendulumStateWithViz(InvPendulumState):
         super(InvPendulumStateWithViz, self).advance(delta_t)
 
         # after advancing, send things to drawing loop
-        shapes = []
-        for body in (self._cart_body, self._pend_body):
-            shapes += [{
-                'vertices': [(v.x, v.y) for v in shape.get_vertices()],
-                'angle'   : body.angle,
-                'position': (body.position.x, body.position.y),
-            } for shape in body.shapes]
-
-        lines = []
-        for line in (self._ground,):
-            lines += [{
-                'radius'  : line.radius,
-                'vertices': ((line.a.x, line.a.y), (line.b.x, line.b.y)),
-            }]
+        self._publish_poses()
 
-        coord_dict = {
-            'shapes': shapes,
-            'lines' : lines
-        }
-
-        try:
-            self._coord_q.put_nowait(coord_dict)
-        except Full:
-            pass
+    def _publish_poses(self) -> None:
+        # slice assignment takes the array lock, so the update is atomic
+        poses = []
+        for body in self._viz_bodies:
+            poses += (body.position.x, body.position.y, body.angle)
+        self._body_poses[:] = poses
 
 
 class InvPendulumController(Controller):
@@ -346,6 +349,9 @@ class InvPendulumController(Controller):
     K = [-57.38901804, -36.24133932, 118.51380879, 28.97241832]
     NBAR = -57.25
 
+    #: a handful of arithmetic operations, safe to run on the network thread
+    process_is_sync = True
+
     def __init__(self, ref: float = 0.0, max_force: float = 25):
         """
 